@@ -10,68 +10,326 @@ Covers:
 Run: python3 process_management.py --task <1|2|3|4|5> [options]
 """
 import os
+import re
 import sys
 import time
-import subprocess
+import asyncio
+import pickle
+import select
+import socket
+import struct
 import argparse
-import shlex
 import platform
-from pathlib import Path
+
+def _burn_py(n):
+    s = 0
+    for k in range(n):
+        s += (k & 1)
+    return s
+
+def _burn_numpy(n):
+    # process in 1M-element chunks so peak extra memory stays ~8 MB;
+    # the AND + reduction run as a single vectorized C loop inside NumPy
+    s = 0
+    chunk = 1 << 20
+    for start in range(0, n, chunk):
+        arr = np.arange(start, min(start + chunk, n), dtype=np.int64)
+        s += int((arr & 1).sum())
+    return s
+
+# Make the task5 workload native: interpreted Python runs ~40 ns/iter, too
+# fast per quantum for nice() differences to show up. Prefer Numba's JIT,
+# then NumPy's vectorized reduction, then the plain Python loop.
+try:
+    from numba import njit
+    burn = njit(cache=True)(_burn_py)
+except ImportError:
+    try:
+        import numpy as np
+        burn = _burn_numpy
+    except ImportError:
+        burn = _burn_py
+
+def _run_workload(workload, iterations):
+    """Burn CPU in one of several flavors for the task5 children.
+
+    'loop' is the classic accumulator, 'hash' drives OpenSSL's SHA-256
+    (SHA-NI on recent x86, so genuinely compute-bound native code), and
+    'matmul' hammers an L2-sized NumPy matrix product.
+    """
+    if workload == "hash":
+        import hashlib
+        h = hashlib.sha256()
+        block = b"\0" * 4096
+        for _ in range(iterations):
+            h.update(block)
+        return int.from_bytes(h.digest()[:4], "big")
+    if workload == "matmul":
+        try:
+            import numpy
+        except ImportError:
+            print("[Task 5] numpy not installed; falling back to loop workload", flush=True)
+            return burn(iterations)
+        a = numpy.random.rand(256, 256)  # ~512 kB operand, fits in L2
+        for _ in range(max(1, iterations // 1000)):
+            a = a @ a
+            a /= numpy.abs(a).max()  # keep values bounded across repeats
+        return int(a[0, 0] * 1000)
+    return burn(iterations)
 
 def ensure_linux():
     if platform.system() != "Linux":
         print("WARNING: This script requires Linux (os.fork and /proc). Exiting.")
         sys.exit(1)
 
-def task1_create_children(n):
+def wait_for_children(children):
+    """Yield (pid, status) for each child in the order they actually finish.
+
+    Uses pidfd_open + epoll (Linux >= 5.3, Python >= 3.9) so the parent only
+    wakes for its own children and reaps each one by pid, instead of waking on
+    every SIGCHLD via os.wait(). Falls back to plain os.wait() on old kernels.
+    """
+    try:
+        ep = select.epoll()
+        pidmap = {}
+        try:
+            for pid in children:
+                pfd = os.pidfd_open(pid)
+                pidmap[pfd] = pid
+                ep.register(pfd, select.EPOLLIN)
+        except (AttributeError, OSError):
+            # pidfd_open unavailable: close anything registered and fall back
+            for pfd in pidmap:
+                os.close(pfd)
+            ep.close()
+            for _ in children:
+                yield os.wait()
+            return
+    except AttributeError:
+        for _ in children:
+            yield os.wait()
+        return
+    try:
+        while pidmap:
+            for pfd, _event in ep.poll():
+                pid = pidmap.pop(pfd)
+                _, status = os.waitpid(pid, 0)
+                os.close(pfd)
+                yield pid, status
+    finally:
+        ep.close()
+
+async def _wait_children_async(children):
+    """asyncio analogue of wait_for_children(): reap via pidfds on the loop.
+
+    Each child's pidfd is registered with loop.add_reader, so reaping
+    overlaps with whatever else the loop is doing; returns (pid, status)
+    pairs in actual finish order. Same mechanism as the stdlib's
+    PidfdChildWatcher.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    for pid in children:
+        pfd = os.pidfd_open(pid)
+
+        def _reap(pfd=pfd, pid=pid):
+            loop.remove_reader(pfd)
+            _, status = os.waitpid(pid, 0)
+            os.close(pfd)
+            queue.put_nowait((pid, status))
+
+        loop.add_reader(pfd, _reap)
+    return [await queue.get() for _ in children]
+
+async def _task2_async(n, argv):
+    procs = []
+    for _ in range(n):
+        try:
+            proc = await asyncio.create_subprocess_exec(*argv)
+        except FileNotFoundError:
+            print(f"[Parent] spawn failed: {argv[0]} not found", flush=True)
+            continue
+        print(f"[Parent] spawned child PID={proc.pid} for command", flush=True)
+        procs.append(proc)
+    # children are reaped concurrently as they exit, not in spawn order
+    codes = await asyncio.gather(*(p.wait() for p in procs))
+    for proc, code in zip(procs, codes):
+        print(f"[Parent] reaped pid={proc.pid} exit code={code}", flush=True)
+
+class WorkerPool:
+    """K long-lived worker children that posix_spawn commands on demand.
+
+    The parent sends pickled argv lists over per-worker SOCK_SEQPACKET
+    socketpairs; each worker spawns the command, reaps it and sends the wait
+    status back. The process-creation cost is paid K times up front instead
+    of once per command, so for N >> K commands the per-command cost drops
+    to one small message plus one posix_spawn. Replies arrive per-worker in
+    FIFO order, so no sequence tagging is needed.
+    """
+
+    def __init__(self, k):
+        self._workers = []
+        self._pending = []
+        for _ in range(k):
+            parent_sock, child_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+            pid = os.fork()
+            if pid == 0:
+                parent_sock.close()
+                # also drop the inherited parent ends of earlier workers'
+                # sockets, otherwise those workers never see EOF at close()
+                for _, prev_sock in self._workers:
+                    prev_sock.close()
+                self._worker_loop(child_sock)  # never returns
+            child_sock.close()
+            self._workers.append((pid, parent_sock))
+            self._pending.append(0)
+        self._next = 0
+
+    @staticmethod
+    def _worker_loop(sock):
+        while True:
+            msg = sock.recv(65536)
+            if not msg:  # parent closed its end: shut down
+                os._exit(0)
+            argv = pickle.loads(msg)
+            try:
+                pid = os.posix_spawnp(argv[0], argv, os.environ)
+                _, status = os.waitpid(pid, 0)
+            except FileNotFoundError:
+                print(f"[Worker] spawn failed: {argv[0]} not found", flush=True)
+                status = 127 << 8  # same wait status a shell reports for "not found"
+            sock.send(struct.pack("!i", status))
+
+    def submit(self, argv):
+        i = self._next
+        self._next = (i + 1) % len(self._workers)
+        self._workers[i][1].send(pickle.dumps(argv))
+        self._pending[i] += 1
+
+    def wait_all(self):
+        statuses = []
+        for i, (_pid, sock) in enumerate(self._workers):
+            for _ in range(self._pending[i]):
+                (status,) = struct.unpack("!i", sock.recv(4))
+                statuses.append(status)
+            self._pending[i] = 0
+        return statuses
+
+    def close(self):
+        for pid, sock in self._workers:
+            sock.close()
+            os.waitpid(pid, 0)
+        self._workers = []
+
+def task1_create_children(n, use_async=False):
     print(f"[Task 1] Parent PID: {os.getpid()}, creating {n} children", flush=True)
     children = []
+    log = []
+    fork = os.fork  # bind locally so the spawn loop is little more than the syscall
     for i in range(n):
-        pid = os.fork()
+        pid = fork()
         if pid == 0:
             # child
             print(f"[Child] PID={os.getpid()} PPID={os.getppid()} Message='Hello from child {i+1}'", flush=True)
-            time.sleep(1)
             os._exit(0)
         else:
             children.append(pid)
-            print(f"[Parent] spawned child PID={pid}", flush=True)
+            log.append(f"[Parent] spawned child PID={pid}\n")
+    # one write() for the whole spawn phase instead of one per child
+    sys.stdout.writelines(log)
+    sys.stdout.flush()
     # parent waits
-    for _ in children:
-        waited_pid, status = os.wait()
-        print(f"[Parent] wait() returned pid={waited_pid} status={status}", flush=True)
+    reaped = asyncio.run(_wait_children_async(children)) if use_async else wait_for_children(children)
+    for waited_pid, status in reaped:
+        print(f"[Parent] reaped pid={waited_pid} status={status}", flush=True)
     print("[Task 1] All children reaped.", flush=True)
 
-def task2_exec_children(n, cmd, use_exec=True):
-    argv = shlex.split(cmd)
+def _child_cleanup():
+    """Close every inherited fd above stdio in a freshly forked child.
+
+    Keeps exec'd programs from inheriting whatever descriptors the parent
+    happens to have open (sockets, pidfds, epoll instances, ...).
+    """
+    os.closerange(3, os.sysconf("SC_OPEN_MAX"))
+
+def task2_exec_children(n, argv, use_fork=False, use_async=False):
+    if isinstance(argv, str):
+        # backward compatibility: a quoted --cmd string still works, but the
+        # preferred path is an already-tokenized argv straight from the shell
+        import shlex
+        argv = shlex.split(argv)
     print(f"[Task 2] Parent PID={os.getpid()}, running {n} children each executing: {argv}", flush=True)
-    for i in range(n):
-        pid = os.fork()
-        if pid == 0:
-            # in child
-            print(f"[Child {i+1}] PID={os.getpid()} PPID={os.getppid()} ABOUT TO RUN: {argv}", flush=True)
-            if use_exec:
+    if use_async:
+        asyncio.run(_task2_async(n, argv))
+    elif use_fork:
+        # classic textbook fork+exec: duplicates the parent's page tables
+        # only to throw them away at execvp (kept for demonstration)
+        children = []
+        log = []
+        # flush before forking so no buffered output is duplicated into (and
+        # re-emitted by) every child -- the classic Python fork gotcha
+        sys.stdout.flush()
+        for i in range(n):
+            pid = os.fork()
+            if pid == 0:
+                # in child: drop every fd above stdio before exec'ing
+                _child_cleanup()
+                print(f"[Child {i+1}] PID={os.getpid()} PPID={os.getppid()} ABOUT TO RUN: {argv}", flush=True)
                 try:
                     os.execvp(argv[0], argv)
                 except FileNotFoundError:
                     print(f"[Child {i+1}] exec failed: {argv[0]} not found", flush=True)
                     os._exit(1)
-            else:
-                # use subprocess instead (child will return back)
-                subprocess.run(argv)
-                print(f"[Child {i+1}] subprocess finished, exiting", flush=True)
-                os._exit(0)
-        else:
-            print(f"[Parent] spawned child PID={pid} for command", flush=True)
-    # parent waits for all
-    while True:
-        try:
-            pid, status = os.wait()
-            print(f"[Parent] waited pid={pid} status={status}", flush=True)
-        except ChildProcessError:
-            break
+            children.append(pid)
+            log.append(f"[Parent] spawned child PID={pid} for command\n")
+        sys.stdout.writelines(log)
+        sys.stdout.flush()
+        # parent waits for all
+        for pid, status in wait_for_children(children):
+            print(f"[Parent] reaped pid={pid} status={status}", flush=True)
+    else:
+        # run the N commands through a small pool of persistent workers, so
+        # forking happens once per worker rather than once per command
+        pool = WorkerPool(min(n, os.cpu_count() or 1))
+        log = []
+        for i in range(n):
+            pool.submit(argv)
+            log.append(f"[Parent] submitted command {i+1}/{n} to worker pool\n")
+        sys.stdout.writelines(log)
+        sys.stdout.flush()
+        for status in pool.wait_all():
+            print(f"[Parent] command finished with wait status={status}", flush=True)
+        pool.close()
     print("[Task 2] All children finished.", flush=True)
 
+def _read_state(pid):
+    """Return the State: value from /proc/[pid]/status, e.g. 'Z (zombie)'."""
+    fd = os.open(f"/proc/{pid}/status", os.O_RDONLY)
+    try:
+        buf = os.read(fd, 8192)
+    finally:
+        os.close(fd)
+    m = re.search(rb"^State:\s*([^\n]*)", buf, re.M)
+    return m.group(1).decode() if m else "?"
+
+def _find_zombies():
+    """Yield the pid of every zombie process, by scanning /proc directly.
+
+    One readdir plus one small stat read per process -- what ps -el does,
+    minus the fork+exec of ps, its full formatting pass and the pipe I/O.
+    """
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry.name}/stat", "rb") as f:
+                buf = f.read()
+        except OSError:
+            continue  # process vanished mid-scan
+        # state is the first field after the ')' closing comm
+        if buf.rsplit(b") ", 1)[1][:1] == b"Z":
+            yield int(entry.name)
+
 def task3_zombie_demo():
     print("[Task 3 - zombie] Starting demo", flush=True)
     pid = os.fork()
@@ -80,19 +338,26 @@ def task3_zombie_demo():
         print(f"[Child] PID={os.getpid()} exiting immediately (becomes zombie until parent waits).", flush=True)
         os._exit(0)
     else:
-        print(f"[Parent] PID={os.getpid()} NOT calling wait() yet. Checking for defunct processes...", flush=True)
-        # run ps and grep for defunct
-        p = subprocess.run(["ps", "-el"], capture_output=True, text=True)
-        lines = [L for L in p.stdout.splitlines() if "defunct" in L or "<defunct>" in L]
-        if lines:
-            print("[Parent] Found defunct lines (zombie):")
-            for L in lines:
-                print(L)
-        else:
-            print("[Parent] No defunct lines found (timing may vary). Full ps output (filtered for 'defunct'):", flush=True)
-        # now wait and reap child so script ends cleanly
-        time.sleep(2)
-        waited = os.wait()
+        print(f"[Parent] PID={os.getpid()} NOT calling wait() yet. Watching child via pidfd...", flush=True)
+        # a pidfd becomes readable exactly when the child is reapable, i.e.
+        # the moment it turns into a zombie -- no ps fork+exec, no race
+        pfd = os.pidfd_open(pid)
+        try:
+            poller = select.poll()
+            poller.register(pfd, select.POLLIN)
+            if poller.poll(2000):
+                state = _read_state(pid)
+                print(f"[Parent] Child {pid} state before wait(): {state}", flush=True)
+                if state.startswith("Z"):
+                    print(f"[Parent] Child {pid} is a zombie (defunct) until we wait() on it.", flush=True)
+                zombies = list(_find_zombies())
+                print(f"[Parent] Zombie pids system-wide (scanned /proc): {zombies}", flush=True)
+            else:
+                print("[Parent] Timed out waiting for child to exit.", flush=True)
+            # now reap the child so the script ends cleanly
+            waited = os.waitpid(pid, 0)
+        finally:
+            os.close(pfd)
         print(f"[Parent] After wait(): {waited}", flush=True)
         print("[Task 3 - zombie] Demo complete.", flush=True)
 
@@ -112,74 +377,145 @@ def task3_orphan_demo(sleep_child=10):
         print(f"[Child] After sleep: PID={child_pid} now PPID={os.getppid()} (should be 1 if orphaned).", flush=True)
         os._exit(0)
 
-def task4_inspect(pid):
+# fields of interest in /proc/[pid]/status, matched in one C-level pass
+_STATUS_FIELDS = re.compile(rb"^(?:Name|State|VmRSS|VmSize|Threads):[^\n]*", re.M)
+
+def _parse_u64(buf, start):
+    """Parse an unsigned decimal straight out of a bytes buffer.
+
+    Skips leading spaces/tabs at `start`, accumulates digits, and returns
+    (value, end_index). Avoids slicing out a temporary str and running
+    CPython's general-purpose int() parser for these short /proc fields.
+    """
+    i = start
+    n = len(buf)
+    while i < n and buf[i] in (0x20, 0x09):
+        i += 1
+    acc = 0
+    while i < n and 0x30 <= buf[i] <= 0x39:
+        acc = acc * 10 + (buf[i] - 0x30)
+        i += 1
+    return acc, i
+
+def _read_at(dirfd, name):
+    """Read a small /proc file relative to an already-open directory fd."""
+    fd = os.open(name, os.O_RDONLY, dir_fd=dirfd)
+    try:
+        return os.read(fd, 8192)
+    finally:
+        os.close(fd)
+
+def task4_inspect(pid, numeric=False):
     print(f"[Task 4] Inspecting PID {pid}", flush=True)
-    proc = Path(f"/proc/{pid}")
-    if not proc.exists():
-        print(f"[Task 4] /proc/{pid} does not exist. Process may not be running or you lack permission.", flush=True)
-        return
-    # read /proc/[pid]/status
-    status_path = proc / "status"
-    print("\n-- status --")
+    # plain f-string paths: no PurePath construction/normalization per access
+    base = f"/proc/{pid}"
+    # open /proc/<pid> once; every per-file openat below reuses this dirfd
+    # instead of redoing the <pid> dentry lookup per file
     try:
-        with open(status_path, "r") as f:
-            for line in f:
-                if line.startswith(("Name:", "State:", "VmRSS:", "VmSize:", "Threads:")):
-                    print(line.strip())
-    except Exception as e:
-        print("Error reading status:", e)
-    # exe
+        dirfd = os.open(base, os.O_PATH | os.O_DIRECTORY)
+    except OSError:
+        print(f"[Task 4] {base} does not exist. Process may not be running or you lack permission.", flush=True)
+        return
     try:
-        exe = os.readlink(str(proc / "exe"))
-        print("\n-- exe ->", exe)
-    except Exception as e:
-        print("\n-- exe not readable:", e)
-    # fd
+        # read /proc/[pid]/status
+        print("\n-- status --")
+        try:
+            # one read() into a bytes buffer, then a single regex pass: avoids
+            # text-IO's per-line reads, UTF-8 decode and startswith tuple checks
+            buf = _read_at(dirfd, "status")
+            numeric_vals = []
+            for m in _STATUS_FIELDS.finditer(buf):
+                line = m.group(0)
+                print(line.decode())
+                if numeric and not line.startswith((b"Name:", b"State:")):
+                    name = line.split(b":", 1)[0]
+                    val, _ = _parse_u64(buf, m.start() + len(name) + 1)
+                    numeric_vals.append(f"{name.decode()}={val}")
+            if numeric_vals:
+                # VmSize/VmRSS are in kB; Threads is a plain count
+                print("numeric:", " ".join(numeric_vals))
+        except Exception as e:
+            print("Error reading status:", e)
+        # stat / statm through the same dirfd
+        try:
+            # comm can contain spaces, so split the fields off after ')'
+            stat_fields = _read_at(dirfd, "stat").rsplit(b") ", 1)[1].split()
+            statm_fields = _read_at(dirfd, "statm").split()
+            page_kb = os.sysconf("SC_PAGESIZE") // 1024
+            print("\n-- stat --")
+            print(f"state={stat_fields[0].decode()} ppid={stat_fields[1].decode()} "
+                  f"utime={stat_fields[11].decode()} stime={stat_fields[12].decode()}")
+            print("\n-- statm --")
+            print(f"size={int(statm_fields[0]) * page_kb} kB resident={int(statm_fields[1]) * page_kb} kB")
+        except Exception as e:
+            print("\n-- stat/statm not readable:", e)
+        # exe
+        try:
+            exe = os.readlink("exe", dir_fd=dirfd)
+            print("\n-- exe ->", exe)
+        except Exception as e:
+            print("\n-- exe not readable:", e)
+    finally:
+        os.close(dirfd)
+    # fd: hold the directory open and resolve each link relative to it
+    # (readlinkat), so the kernel walks /proc/<pid>/fd/ only once
     try:
-        fds = list((proc / "fd").iterdir())
-        print(f"\n-- {len(fds)} open file descriptors:")
-        for fd in fds:
-            try:
-                target = os.readlink(fd)
-                print(f"{fd.name} -> {target}")
-            except Exception as e:
-                print(f"{fd.name} -> (unreadable) {e}")
+        dirfd = os.open(f"/proc/{pid}/fd", os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            names = os.listdir(dirfd)
+            print(f"\n-- {len(names)} open file descriptors:")
+            for name in names:
+                try:
+                    target = os.readlink(name, dir_fd=dirfd)
+                    print(f"{name} -> {target}")
+                except Exception as e:
+                    print(f"{name} -> (unreadable) {e}")
+        finally:
+            os.close(dirfd)
     except Exception as e:
         print("\n-- fd not accessible:", e)
 
-def task5_priority(n_children=3, iterations=3_000_000):
+def task5_priority(n_children=3, iterations=3_000_000, pin=None, use_async=False, workload="loop"):
     print(f"[Task 5] Spawning {n_children} CPU-bound children with different nice values.", flush=True)
     children = []
+    log = []
     nicelist = [0, 5, 10, 15, 19]  # typical choices; we'll take first n_children
     nicelist = nicelist[:n_children]
+    fork = os.fork
     for i, niceval in enumerate(nicelist):
-        pid = os.fork()
+        pid = fork()
         if pid == 0:
             # child
             try:
                 os.nice(niceval)
             except Exception:
                 pass
+            if pin:
+                # 'shared' piles every child onto CPU 0 so they must compete
+                # and nice weighting decides finish order; 'spread' gives
+                # each child its own CPU (no contention, but cache locality)
+                cpu = 0 if pin == "shared" else i % (os.cpu_count() or 1)
+                try:
+                    os.sched_setaffinity(0, {cpu})
+                except OSError:
+                    pass
             imp_pid = os.getpid()
             print(f"[Child] PID={imp_pid} nice={niceval} starting work.", flush=True)
             # CPU-bound work (tunable)
-            s = 0
-            for k in range(iterations):
-                s += (k & 1)
+            s = _run_workload(workload, iterations)
             print(f"[Child] PID={imp_pid} nice={niceval} finished work. result={s}", flush=True)
             os._exit(0)
         else:
             children.append(pid)
-            print(f"[Parent] spawned child {pid} with target nice={niceval}", flush=True)
+            log.append(f"[Parent] spawned child {pid} with target nice={niceval}\n")
+    sys.stdout.writelines(log)
+    sys.stdout.flush()
     # parent waits and logs finish order as they exit
     order = []
-    try:
-        while True:
-            pid, status = os.wait()
-            order.append(pid)
-            print(f"[Parent] Child finished: pid={pid} status={status}", flush=True)
-    except ChildProcessError:
-        pass
+    reaped = asyncio.run(_wait_children_async(children)) if use_async else wait_for_children(children)
+    for pid, status in reaped:
+        order.append(pid)
+        print(f"[Parent] Child finished: pid={pid} status={status}", flush=True)
     print("[Task 5] Finish order (PIDs):", order, flush=True)
 
 def main():
@@ -187,15 +523,25 @@ def main():
     parser = argparse.ArgumentParser(description="OS Lab tasks: fork/exec/zombie/orphan/proc/nice")
     parser.add_argument("--task", required=True, choices=["1","2","3z","3o","4","5"], help="which task: 1, 2, 3z (zombie), 3o (orphan), 4, 5")
     parser.add_argument("--n", type=int, default=3, help="number of child processes")
-    parser.add_argument("--cmd", type=str, default="ls -l", help="command for task2 (quoted)")
+    parser.add_argument("--cmd", type=str, default="ls -l", help="command for task2 (quoted; superseded by a trailing command)")
+    parser.add_argument("--use-fork", action="store_true", help="task2: use classic fork+execvp instead of posix_spawnp")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="tasks 1/2/5: coordinate spawning and reaping on an asyncio event loop")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="command for task2 given directly after the options (no quoting/splitting needed)")
     parser.add_argument("--pid", type=int, help="pid for task4")
+    parser.add_argument("--numeric", action="store_true", help="task4: also print VmRSS/VmSize/Threads as parsed integers")
     parser.add_argument("--iterations", type=int, default=2_000_000, help="work iterations for task5 (lower on weak machines)")
+    parser.add_argument("--pin", choices=["shared", "spread"], help="task5: pin children to CPU 0 (shared, makes nice ordering visible) or one CPU each (spread)")
+    parser.add_argument("--workload", choices=["loop", "hash", "matmul"], default="loop", help="task5: CPU workload flavor for the children")
     args = parser.parse_args()
 
     if args.task == "1":
-        task1_create_children(args.n)
+        task1_create_children(args.n, use_async=args.use_async)
     elif args.task == "2":
-        task2_exec_children(args.n, args.cmd, use_exec=True)
+        command = args.command
+        if command and command[0] == "--":
+            # argparse.REMAINDER keeps the conventional "--" separator
+            command = command[1:]
+        task2_exec_children(args.n, command or args.cmd, use_fork=args.use_fork, use_async=args.use_async)
     elif args.task == "3z":
         task3_zombie_demo()
     elif args.task == "3o":
@@ -204,9 +550,9 @@ def main():
         if not args.pid:
             print("Please provide --pid <pid> for task 4", flush=True)
             sys.exit(1)
-        task4_inspect(args.pid)
+        task4_inspect(args.pid, numeric=args.numeric)
     elif args.task == "5":
-        task5_priority(args.n, args.iterations)
+        task5_priority(args.n, args.iterations, pin=args.pin, use_async=args.use_async, workload=args.workload)
     else:
         print("Unknown task", flush=True)
 